@@ -3,11 +3,15 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import ast
 import datetime
+import functools
+import html.entities as htmlentities
 import logging
 import os
 import random
 import re
 import time
+from http.client import HTTPException
+from urllib.parse import quote, quote_plus, urlencode
 from xml.etree import ElementTree  # noqa: ICN001
 
 import requests
@@ -32,41 +36,10 @@ except ImportError:
     import json
 
 try:
-    # Python 3.X
-    from urllib.parse import urlencode
+    # Used to decode responses, if installed.
+    import orjson
 except ImportError:
-    # Python 2.X
-    from urllib import urlencode
-
-try:
-    # Python 3.X
-    from urllib.parse import quote
-except ImportError:
-    # Python 2.X
-    from urllib import quote
-
-try:
-    # Python 3.X
-    import html.entities as htmlentities
-except ImportError:
-    # Python 2.X
-    import htmlentitydefs as htmlentities
-
-try:
-    # Python 3.X
-    from http.client import HTTPException
-except ImportError:
-    from httplib import HTTPException
-
-try:
-    # Python 2.X
-    unicode_char = unichr
-except NameError:
-    # Python 3.X
-    unicode_char = chr
-    # Ugh.
-    long = int  # NOQA: A001
-
+    orjson = None
 
 __author__ = "Daniel Lindsley, Joseph Kocherhans, Jacob Kaplan-Moss, Thomas Rieder"
 __all__ = ["Solr"]
@@ -82,7 +55,8 @@ def get_version():
 
 
 DATETIME_REGEX = re.compile(
-    r"^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})T(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})(\.\d+)?Z$"  # NOQA: E501
+    r"^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})T(?P<hour>\d{2}):(?P<minute>\d{2}):(?P<second>\d{2})(\.\d+)?Z$",  # NOQA: E501
+    re.ASCII,
 )
 # dict key used to add nested documents to a document
 NESTED_DOC_KEY = "_childDocuments_"
@@ -91,6 +65,24 @@ VALID_XML_CHARS_REGEX = re.compile(
     "[^\u0020-\uD7FF\u0009\u000A\u000D\uE000-\uFFFD\U00010000-\U0010FFFF]+"
 )
 
+# Matches hexadecimal (&#x64;) and decimal (&#149;) character references as
+# well as named entities (&amp;), capturing everything between "&" and ";":
+HTML_ENTITY_REGEX = re.compile(r"&(#x[0-9a-fA-F]+|#[0-9]+|\w+);")
+# The character each named HTML entity stands for:
+HTML_ENTITY_CHARS = {
+    name: chr(codepoint) for name, codepoint in htmlentities.name2codepoint.items()
+}
+# Longest input whose unescaped form is memoized by ``unescape_html``:
+UNESCAPE_HTML_CACHE_MAX_LENGTH = 512
+# Longest parameter name or value whose quoted form is memoized by
+# ``safe_urlencode``:
+QUOTE_PARAM_CACHE_MAX_LENGTH = 256
+
+# Match the leading text of the elements which hold the error message in the
+# HTML error pages served by Jetty (<pre>) and other servers (<title>):
+HTML_PRE_REGEX = re.compile(r"<pre(?:\s[^>]*)?>([^<]*)", re.IGNORECASE)
+HTML_TITLE_REGEX = re.compile(r"<title(?:\s[^>]*)?>([^<]*)", re.IGNORECASE)
+
 
 class NullHandler(logging.Handler):
     def emit(self, record):
@@ -125,18 +117,17 @@ def force_unicode(value):
     """
     Forces a bytestring to become a Unicode string.
     """
-    if IS_PY3:
-        # Python 3.X
-        if isinstance(value, bytes):
-            value = value.decode("utf-8", errors="replace")
-        elif not isinstance(value, str):
-            value = str(value)
-    else:
-        # Python 2.X
-        if isinstance(value, str):
-            value = value.decode("utf-8", "replace")
-        elif not isinstance(value, basestring):  # NOQA: F821
-            value = unicode(value)  # NOQA: F821
+    # Exact type checks first: nearly every call already has a ``str``.
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is bytes:
+        return value.decode("utf-8", errors="replace")
+
+    if isinstance(value, bytes):
+        value = value.decode("utf-8", errors="replace")
+    elif not isinstance(value, str):
+        value = str(value)
 
     return value
 
@@ -145,16 +136,44 @@ def force_bytes(value):
     """
     Forces a Unicode string to become a bytestring.
     """
-    if IS_PY3:
-        if isinstance(value, str):
-            value = value.encode("utf-8", "backslashreplace")
-    else:
-        if isinstance(value, unicode):  # NOQA: F821
-            value = value.encode("utf-8")
+    value_type = type(value)
+    if value_type is bytes:
+        return value
+    if value_type is str:
+        return value.encode("utf-8", "backslashreplace")
+
+    if isinstance(value, str):
+        value = value.encode("utf-8", "backslashreplace")
 
     return value
 
 
+def _unescape_entity(m):
+    name = m.group(1)
+    if name[0] == "#":
+        # character reference
+        try:
+            if name[1] == "x":
+                return chr(int(name[2:], 16))
+            else:
+                return chr(int(name[1:]))
+        except (ValueError, OverflowError):
+            pass
+    else:
+        # named entity
+        char = HTML_ENTITY_CHARS.get(name)
+        if char is not None:
+            return char
+    return m.group(0)  # leave as is
+
+
+def _unescape_html(text):
+    return HTML_ENTITY_REGEX.sub(_unescape_entity, text)
+
+
+_cached_unescape_html = functools.lru_cache(maxsize=4096)(_unescape_html)
+
+
 def unescape_html(text):
     """
     Removes HTML or XML character references and entities from a text string.
@@ -164,27 +183,22 @@ def unescape_html(text):
 
     Source: http://effbot.org/zone/re-sub.htm#unescape-html
     """
+    # Error pages repeat the same short fragments, so those are memoized;
+    # long inputs are converted directly rather than kept alive in the cache.
+    if len(text) <= UNESCAPE_HTML_CACHE_MAX_LENGTH:
+        return _cached_unescape_html(text)
+    return _unescape_html(text)
 
-    def fixup(m):
-        text = m.group(0)
-        if text[:2] == "&#":
-            # character reference
-            try:
-                if text[:3] == "&#x":
-                    return unicode_char(int(text[3:-1], 16))
-                else:
-                    return unicode_char(int(text[2:-1]))
-            except ValueError:
-                pass
-        else:
-            # named entity
-            try:
-                text = unicode_char(htmlentities.name2codepoint[text[1:-1]])
-            except KeyError:
-                pass
-        return text  # leave as is
 
-    return re.sub(r"&#?\w+;", fixup, text)
+_cached_quote_plus = functools.lru_cache(maxsize=1024)(quote_plus)
+
+
+def _quote_param(string, safe="", encoding=None, errors=None):
+    # Parameter names and many values (wt, fl, fq, ...) repeat on every request,
+    # so short strings are memoized; long queries are simply quoted.
+    if len(string) <= QUOTE_PARAM_CACHE_MAX_LENGTH:
+        return _cached_quote_plus(string, safe, encoding, errors)
+    return quote_plus(string, safe, encoding, errors)
 
 
 def safe_urlencode(params, doseq=0):
@@ -194,23 +208,44 @@ def safe_urlencode(params, doseq=0):
     The stdlib safe_urlencode prior to Python 3.x chokes on UTF-8 values
     which can't fail down to ascii.
     """
-    if IS_PY3:
-        return urlencode(params, doseq)
+    return urlencode(params, doseq, quote_via=_quote_param)
+
+
+def escape_xml_text(text):
+    """
+    Escapes a string for use as XML element text.
+    """
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
 
-    if hasattr(params, "items"):
-        params = params.items()
 
-    new_params = []
+def escape_xml_attrib(text):
+    """
+    Escapes a string for use as a double-quoted XML attribute value.
 
-    for k, v in params:
-        k = k.encode("utf-8")
+    Whitespace other than spaces is encoded as character references so that
+    it survives attribute-value normalization.
+    """
+    text = escape_xml_text(text)
+    if '"' in text:
+        text = text.replace('"', "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
 
-        if isinstance(v, (list, tuple)):
-            new_params.append((k, [force_bytes(i) for i in v]))
-        else:
-            new_params.append((k, force_bytes(v)))
 
-    return urlencode(new_params, doseq)
+# Field names and update modifiers repeat for every document, so their escaped
+# forms are memoized:
+_cached_escape_xml_attrib = functools.lru_cache(maxsize=4096)(escape_xml_attrib)
 
 
 def clean_xml_string(s):
@@ -224,10 +259,61 @@ def clean_xml_string(s):
     return VALID_XML_CHARS_REGEX.sub("", s)
 
 
+def _datetime_from_python(value):
+    offset = value.utcoffset()
+    if offset:
+        value = value - offset
+    return value.replace(tzinfo=None).isoformat() + "Z"
+
+
+def _date_from_python(value):
+    return "%sT00:00:00Z" % value.isoformat()
+
+
+def _bool_from_python(value):
+    return "true" if value else "false"
+
+
+def _bytes_from_python(value):
+    return clean_xml_string(str(value, errors="replace"))
+
+
+# Converters used by ``Solr._from_python``, keyed on the exact type of the value
+# so the common cases skip the duck-typing checks. Subclasses and anything else
+# fall through to those checks.
+FROM_PYTHON_CONVERTERS = {
+    str: clean_xml_string,
+    bytes: _bytes_from_python,
+    bool: _bool_from_python,
+    int: str,
+    float: str,
+    datetime.datetime: _datetime_from_python,
+    datetime.date: _date_from_python,
+}
+
+
 class SolrError(Exception):
     pass
 
 
+class OrjsonDecoder(json.JSONDecoder):
+    """
+    A ``JSONDecoder`` which decodes using the much faster ``orjson`` library.
+    Pass an instance as ``Solr(..., decoder=OrjsonDecoder())`` to use it.
+
+    orjson rejects some input the standard library accepts (``NaN``, for
+    instance), which is decoded the usual way instead. Beware that integers
+    outside the 64-bit range are *not* rejected: orjson silently turns them
+    into floats, losing precision, where ``json.JSONDecoder`` keeps them exact.
+    """
+
+    def decode(self, s, *args, **kwargs):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super(OrjsonDecoder, self).decode(s, *args, **kwargs)
+
+
 class Results(object):
     """
     Default results class for wrapping decoded (from JSON) solr responses.
@@ -297,10 +383,15 @@ class Results(object):
             return len(self.docs)
 
     def __iter__(self):
+        if not self._next_page_query:
+            # Only one page of results, so the list's own iterator will do:
+            return iter(self.docs)
+        return self._iter_pages()
+
+    def _iter_pages(self):
         result = self
         while result:
-            for d in result.docs:
-                yield d
+            yield from result.docs
             result = result._next_page_query and result._next_page_query()
 
 
@@ -309,7 +400,8 @@ class Solr(object):
     The main object for working with Solr.
 
     Optionally accepts ``decoder`` for an alternate JSON decoder instance.
-    Default is ``json.JSONDecoder()``.
+    Default is ``json.JSONDecoder()``. ``pysolr.OrjsonDecoder()`` is faster
+    when ``orjson`` is installed, but see its docstring for a precision caveat.
 
     Optionally accepts ``encoder`` for an alternate JSON Encoder instance.
     Default is ``json.JSONEncoder()``.
@@ -321,6 +413,13 @@ class Solr(object):
     returned by ``.search()`` and ``.more_like_this()`` methods.
     Default is ``pysolr.Results``.
 
+    Optionally accepts ``session`` for a ``requests.Session`` to send requests
+    with. By default one is created on first use and kept for the lifetime of
+    the instance so that connections are reused; call ``.close()`` to release
+    them. A ``session`` passed in is left open by ``.close()``, since the caller
+    owns it. As with any ``requests.Session``, an instance should not be shared
+    across a ``fork()``.
+
     Usage::
 
         solr = pysolr.Solr('http://localhost:8983/solr')
@@ -352,6 +451,7 @@ class Solr(object):
         self.timeout = timeout
         self.log = self._get_log()
         self.session = session
+        self._own_session = None
         self.results_cls = results_cls
         self.search_handler = search_handler
         self.use_qt_param = use_qt_param
@@ -361,11 +461,21 @@ class Solr(object):
 
     def get_session(self):
         if self.session is None:
-            self.session = requests.Session()
+            self.session = self._own_session = requests.Session()
             self.session.stream = False
             self.session.verify = self.verify
         return self.session
 
+    def close(self):
+        """
+        Closes the session created by ``get_session()`` and its pooled
+        connections. A new session will be created if the instance is used
+        again. A session passed in by the caller is left open.
+        """
+        if self.session is not None and self.session is self._own_session:
+            self.session.close()
+            self.session = self._own_session = None
+
     def _get_log(self):
         return LOG
 
@@ -422,15 +532,15 @@ class Solr(object):
         except requests.exceptions.Timeout as err:
             error_message = "Connection to server '%s' timed out: %s"
             self.log.exception(error_message, url, err)  # NOQA: G200
-            raise SolrError(error_message % (url, err))
+            raise SolrError(error_message % (url, err)) from err
         except requests.exceptions.ConnectionError as err:
             error_message = "Failed to connect to server at %s: %s"
             self.log.exception(error_message, url, err)  # NOQA: G200
-            raise SolrError(error_message % (url, err))
+            raise SolrError(error_message % (url, err)) from err
         except HTTPException as err:
             error_message = "Unhandled error: %s %s: %s"
             self.log.exception(error_message, method, url, err)  # NOQA: G200
-            raise SolrError(error_message % (method, url, err))
+            raise SolrError(error_message % (method, url, err)) from err
 
         end_time = time.time()
         self.log.info(
@@ -532,7 +642,7 @@ class Solr(object):
         path_handler = handler
         if self.use_qt_param:
             path_handler = "select"
-            query_vars.append("qt=%s" % safe_urlencode(handler, True))
+            query_vars.append(safe_urlencode({"qt": handler}))
 
         path = "%s/" % path_handler
 
@@ -620,10 +730,9 @@ class Solr(object):
 
         reason = None
         full_html = ""
-        dom_tree = None
 
         # In Python3, response can be made of bytes
-        if IS_PY3 and hasattr(response, "decode"):
+        if hasattr(response, "decode"):
             response = response.decode()
         if response.startswith("<?xml"):
             # Try a strict XML parse
@@ -654,28 +763,16 @@ class Solr(object):
             else:
                 full_html = "%s" % response
         else:
-            # Let's assume others do produce a valid XML response
-            try:
-                dom_tree = ElementTree.fromstring(response)
-                reason_node = None
-
-                # html page might be different for every server
-                if server_type == "jetty":
-                    reason_node = dom_tree.find("body/pre")
-                else:
-                    reason_node = dom_tree.find("head/title")
+            # html page might be different for every server. Only the text of a
+            # single element is needed, so there's no point parsing the page:
+            if server_type == "jetty":
+                m = HTML_PRE_REGEX.search(response)
+            else:
+                m = HTML_TITLE_REGEX.search(response)
 
-                if reason_node is not None:
-                    reason = reason_node.text
-
-                if reason is None:
-                    full_html = ElementTree.tostring(dom_tree)
-            except SyntaxError as err:
-                LOG.warning(  # NOQA: G200
-                    "Unable to extract error message from invalid XML: %s",
-                    err,
-                    extra={"data": {"response": response}},
-                )
+            if m and m.group(1):
+                reason = unescape_html(m.group(1))
+            else:
                 full_html = "%s" % response
 
         full_html = force_unicode(full_html)
@@ -693,28 +790,20 @@ class Solr(object):
         Converts python values to a form suitable for insertion into the xml
         we send to solr.
         """
+        converter = FROM_PYTHON_CONVERTERS.get(type(value))
+        if converter is not None:
+            return converter(value)
+
         if hasattr(value, "strftime"):
             if hasattr(value, "hour"):
-                offset = value.utcoffset()
-                if offset:
-                    value = value - offset
-                value = value.replace(tzinfo=None).isoformat() + "Z"
+                value = _datetime_from_python(value)
             else:
-                value = "%sT00:00:00Z" % value.isoformat()
+                value = _date_from_python(value)
         elif isinstance(value, bool):
-            if value:
-                value = "true"
-            else:
-                value = "false"
+            value = _bool_from_python(value)
         else:
-            if IS_PY3:
-                # Python 3.X
-                if isinstance(value, bytes):
-                    value = str(value, errors="replace")  # NOQA: F821
-            else:
-                # Python 2.X
-                if isinstance(value, str):
-                    value = unicode(value, errors="replace")  # NOQA: F821
+            if isinstance(value, bytes):
+                value = str(value, errors="replace")
 
             value = "{0}".format(value)
 
@@ -724,7 +813,7 @@ class Solr(object):
         """
         Converts values from Solr to native Python values.
         """
-        if isinstance(value, (int, float, long, complex)):
+        if isinstance(value, (int, float, complex)):
             return value
 
         if isinstance(value, (list, tuple)):
@@ -738,38 +827,13 @@ class Solr(object):
         elif value == "false":
             return False
 
-        is_string = False
-
-        if IS_PY3:
-            if isinstance(value, bytes):
-                value = force_unicode(value)
-
-            if isinstance(value, str):
-                is_string = True
-        else:
-            if isinstance(value, str):
-                value = force_unicode(value)
-
-            if isinstance(value, basestring):  # NOQA: F821
-                is_string = True
-
-        if is_string:
-            possible_datetime = DATETIME_REGEX.search(value)
-
-            if possible_datetime:
-                date_values = possible_datetime.groupdict()
-
-                for dk, dv in date_values.items():
-                    date_values[dk] = int(dv)
+        if isinstance(value, bytes):
+            value = force_unicode(value)
 
-                return datetime.datetime(
-                    date_values["year"],
-                    date_values["month"],
-                    date_values["day"],
-                    date_values["hour"],
-                    date_values["minute"],
-                    date_values["second"],
-                )
+        if isinstance(value, str) and DATETIME_REGEX.match(value):
+            # The match guarantees a plain YYYY-MM-DDTHH:MM:SS prefix; any
+            # fractional seconds are dropped as before:
+            return datetime.datetime.fromisoformat(value[:19])
 
         try:
             # This is slightly gross but it's hard to tell otherwise what the
@@ -791,14 +855,8 @@ class Solr(object):
         if value is None:
             return True
 
-        if IS_PY3:
-            # Python 3.X
-            if isinstance(value, str) and len(value) == 0:
-                return True
-        else:
-            # Python 2.X
-            if isinstance(value, basestring) and len(value) == 0:  # NOQA: F821
-                return True
+        if isinstance(value, str) and len(value) == 0:
+            return True
 
         # TODO: This should probably be removed when solved in core Solr level?
         return False
@@ -939,22 +997,22 @@ class Solr(object):
                 raise ValueError("wrong message type")
         else:
             solrapi = "XML"
-            message = ElementTree.Element("add")
-
-            for doc in docs:
-                el = self._build_xml_doc(doc, boost=boost, fieldUpdates=fieldUpdates)
-                message.append(el)
+            message = [
+                self._build_xml_doc(doc, boost=boost, fieldUpdates=fieldUpdates)
+                for doc in docs
+            ]
 
-            # This returns a bytestring. Ugh.
-            m = ElementTree.tostring(message, encoding="utf-8")
-            # Convert back to Unicode please.
-            m = force_unicode(m)
+            if message:
+                m = "<add>%s</add>" % "".join(message)
+            else:
+                m = "<add />"
 
         return (solrapi, m, len(message))
 
     def _build_json_doc(self, doc, fieldUpdates=None):
         if fieldUpdates is None:
-            cleaned_doc = {k: v for k, v in doc.items() if not self._is_null_value(v)}
+            is_null_value = self._is_null_value
+            cleaned_doc = {k: v for k, v in doc.items() if not is_null_value(v)}
         else:
             # id must be added without a modifier
             # if using field updates, all other fields should have a modifier
@@ -966,16 +1024,19 @@ class Solr(object):
         return cleaned_doc
 
     def _build_xml_doc(self, doc, boost=None, fieldUpdates=None):
-        doc_elem = ElementTree.Element("doc")
+        # Bound once as this is checked for every value of every field:
+        is_null_value = self._is_null_value
+        doc_attrs = ""
+        children = []
 
         for key, value in doc.items():
             if key == NESTED_DOC_KEY:
                 for child in value:
-                    doc_elem.append(self._build_xml_doc(child, boost, fieldUpdates))
+                    children.append(self._build_xml_doc(child, boost, fieldUpdates))
                 continue
 
             if key == "boost":
-                doc_elem.set("boost", force_unicode(value))
+                doc_attrs = ' boost="%s"' % escape_xml_attrib(force_unicode(value))
                 continue
 
             # To avoid multiple code-paths we'd like to treat all of our values
@@ -989,32 +1050,40 @@ class Solr(object):
             if use_field_updates and not values:
                 values = ("",)
             for bit in values:
-                attrs = {"name": key}
+                attrs = ' name="%s"' % _cached_escape_xml_attrib(key)
 
-                if self._is_null_value(bit):
+                if is_null_value(bit):
                     if use_field_updates:
                         bit = ""
-                        attrs["null"] = "true"
+                        attrs += ' null="true"'
                     else:
                         continue
 
                 if key == "_doc":
-                    child = self._build_xml_doc(bit, boost)
-                    doc_elem.append(child)
+                    children.append(self._build_xml_doc(bit, boost))
                     continue
 
                 if use_field_updates:
-                    attrs["update"] = fieldUpdates[key]
+                    attrs += ' update="%s"' % _cached_escape_xml_attrib(
+                        fieldUpdates[key]
+                    )
 
                 if boost and key in boost:
-                    attrs["boost"] = force_unicode(boost[key])
-
-                field = ElementTree.Element("field", **attrs)
-                field.text = self._from_python(bit)
+                    attrs += ' boost="%s"' % escape_xml_attrib(
+                        force_unicode(boost[key])
+                    )
 
-                doc_elem.append(field)
+                text = self._from_python(bit)
+                if text:
+                    children.append(
+                        "<field%s>%s</field>" % (attrs, escape_xml_text(text))
+                    )
+                else:
+                    children.append("<field%s />" % attrs)
 
-        return doc_elem
+        if children:
+            return "<doc%s>%s</doc>" % (doc_attrs, "".join(children))
+        return "<doc%s />" % doc_attrs
 
     def add(
         self,
@@ -1333,6 +1402,12 @@ class SolrCoreAdmin(object):
         solr_admin = SolrCoreAdmin('http://localhost:8983/solr/admin/cores')
         status = solr_admin.status()
 
+    Optionally accepts ``session`` for a ``requests.Session`` to send requests
+    with. By default one is created on first use and kept for the lifetime of
+    the instance so that connections are reused; call ``.close()`` to release
+    them. A ``session`` passed in is left open by ``.close()``, since the caller
+    owns it.
+
     Operations offered by Solr are:
        1. STATUS
        2. CREATE
@@ -1344,9 +1419,25 @@ class SolrCoreAdmin(object):
        8. LOAD (not currently implemented)
     """
 
-    def __init__(self, url, *args, **kwargs):
+    def __init__(self, url, *args, session=None, **kwargs):
         super(SolrCoreAdmin, self).__init__(*args, **kwargs)
         self.url = url
+        self.session = session
+        self._own_session = None
+
+    def get_session(self):
+        if self.session is None:
+            self.session = self._own_session = requests.Session()
+        return self.session
+
+    def close(self):
+        """
+        Closes the session created by ``get_session()`` and its pooled
+        connections. A session passed in by the caller is left open.
+        """
+        if self.session is not None and self.session is self._own_session:
+            self.session.close()
+            self.session = self._own_session = None
 
     def _get_url(self, url, params=None, headers=None):
         if params is None:
@@ -1354,7 +1445,7 @@ class SolrCoreAdmin(object):
         if headers is None:
             headers = {"Content-Type": "application/x-www-form-urlencoded"}
 
-        resp = requests.get(url, data=safe_urlencode(params), headers=headers)
+        resp = self.get_session().get(url, data=safe_urlencode(params), headers=headers)
         return force_unicode(resp.content)
 
     def status(self, core=None):
@@ -1461,13 +1552,13 @@ REPLACEMENTS = (
     (b"\x1f", b""),  # Unit separator
 )
 
+# Every replacement above is a deletion, so they can all be applied in a single
+# pass with ``bytes.translate``:
+SANITIZE_DELETE_CHARS = b"".join(bad for bad, good in REPLACEMENTS)
 
-def sanitize(data):
-    fixed_string = force_bytes(data)
-
-    for bad, good in REPLACEMENTS:
-        fixed_string = fixed_string.replace(bad, good)
 
+def sanitize(data):
+    fixed_string = force_bytes(data).translate(None, SANITIZE_DELETE_CHARS)
     return force_unicode(fixed_string)
 
 
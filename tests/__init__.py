@@ -5,3 +5,6 @@ from __future__ import absolute_import, print_function, unicode_literals
 from .test_admin import *  # NOQA
 from .test_client import *  # NOQA
 from .test_cloud import *  # NOQA
+from .test_conversion import *  # NOQA
+from .test_results import *  # NOQA
+from .test_utils import *  # NOQA
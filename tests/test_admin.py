@@ -3,41 +3,159 @@
 from __future__ import absolute_import, unicode_literals
 
 import unittest
+from unittest.mock import Mock
+from urllib.parse import parse_qsl
+from xml.etree import ElementTree  # noqa: ICN001
 
 from pysolr import SolrCoreAdmin
 
+# Cores created by these tests:
+TEST_CORES = ("wheatley", "rick")
+
 
 class SolrCoreAdminTestCase(unittest.TestCase):
-    def setUp(self):
-        super(SolrCoreAdminTestCase, self).setUp()
-        self.solr_admin = SolrCoreAdmin("http://localhost:8983/solr/admin/cores")
+    @classmethod
+    def setUpClass(cls):
+        super(SolrCoreAdminTestCase, cls).setUpClass()
+        # One instance for the whole class so that its session keeps the
+        # connection to Solr open between tests:
+        cls.solr_admin = SolrCoreAdmin("http://localhost:8983/solr/admin/cores")
+        # Clear out anything left behind by an interrupted run:
+        cls._unload_test_cores()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.solr_admin.close()
+        super(SolrCoreAdminTestCase, cls).tearDownClass()
+
+    @classmethod
+    def _unload_test_cores(cls):
+        """
+        Unloads whichever test cores exist, using a single STATUS request to
+        find them rather than blindly sending an UNLOAD for each one.
+        """
+        status = ElementTree.fromstring(cls.solr_admin.status())
+        existing = {
+            core.get("name") for core in status.findall("lst[@name='status']/lst")
+        }
+
+        for core in TEST_CORES:
+            if core in existing:
+                cls.solr_admin.unload(core)
+
+    def _create_core(self, name):
+        """
+        Creates a core which will be unloaded again once the test is over.
+        """
+        self.addCleanup(self.solr_admin.unload, name)
+        return self.solr_admin.create(name)
+
+    def assertResponseOK(self, response):
+        """
+        Assert that a core admin response reports success.
+        """
+        self.assertIn('<int name="status">0</int>', response)
 
     def test_status(self):
-        self.assertIn('name="defaultCoreName"', self.solr_admin.status())
-        self.assertIn('<int name="status">', self.solr_admin.status(core="core0"))
+        # The all-cores response already includes core0, so one request covers
+        # both; the core parameter is checked in SolrCoreAdminRequestTestCase:
+        status = self.solr_admin.status()
+        self.assertIn('name="defaultCoreName"', status)
+        self.assertIn('<lst name="core0">', status)
 
     def test_create(self):
-        self.assertIn('<int name="status">0</int>', self.solr_admin.create("wheatley"))
+        self.assertResponseOK(self._create_core("wheatley"))
 
     def test_reload(self):
-        self.assertIn('<int name="status">0</int>', self.solr_admin.reload("wheatley"))
+        self._create_core("wheatley")
+        self.assertResponseOK(self.solr_admin.reload("wheatley"))
 
     def test_rename(self):
+        self._create_core("wheatley")
+        self.addCleanup(self.solr_admin.unload, "rick")
+        self.assertResponseOK(self.solr_admin.rename("wheatley", "rick"))
+
+    def test_swap(self):
+        self._create_core("wheatley")
+        self._create_core("rick")
+        self.assertResponseOK(self.solr_admin.swap("wheatley", "rick"))
+
+    def test_unload(self):
         self.solr_admin.create("wheatley")
-        self.assertIn(
-            '<int name="status">0</int>', self.solr_admin.rename("wheatley", "rick")
+        self.assertResponseOK(self.solr_admin.unload("wheatley"))
+
+
+class SolrCoreAdminRequestTestCase(unittest.TestCase):
+    """
+    Checks the requests SolrCoreAdmin sends, without needing a running Solr.
+    """
+
+    def setUp(self):
+        super(SolrCoreAdminRequestTestCase, self).setUp()
+        self.session = Mock()
+        self.session.get.return_value.content = b'<int name="status">0</int>'
+        self.solr_admin = SolrCoreAdmin(
+            "http://localhost:8983/solr/admin/cores", session=self.session
         )
 
-    def test_swap(self):
+    def assertRequestParams(self, params):
+        args, kwargs = self.session.get.call_args
+        self.assertEqual(args, ("http://localhost:8983/solr/admin/cores",))
+        self.assertEqual(dict(parse_qsl(kwargs["data"])), params)
+
+    def test_status(self):
+        self.assertEqual(self.solr_admin.status(), '<int name="status">0</int>')
+        self.assertRequestParams({"action": "STATUS"})
+
+        self.solr_admin.status(core="core0")
+        self.assertRequestParams({"action": "STATUS", "core": "core0"})
+
+    def test_create(self):
         self.solr_admin.create("wheatley")
-        self.solr_admin.create("rick")
-        self.assertIn(
-            '<int name="status">0</int>', self.solr_admin.swap("wheatley", "rick")
+        self.assertRequestParams(
+            {
+                "action": "CREATE",
+                "name": "wheatley",
+                "instanceDir": "wheatley",
+                "config": "solrconfig.xml",
+                "schema": "schema.xml",
+            }
+        )
+
+    def test_reload(self):
+        self.solr_admin.reload("wheatley")
+        self.assertRequestParams({"action": "RELOAD", "core": "wheatley"})
+
+    def test_rename(self):
+        self.solr_admin.rename("wheatley", "rick")
+        self.assertRequestParams(
+            {"action": "RENAME", "core": "wheatley", "other": "rick"}
+        )
+
+    def test_swap(self):
+        self.solr_admin.swap("wheatley", "rick")
+        self.assertRequestParams(
+            {"action": "SWAP", "core": "wheatley", "other": "rick"}
         )
 
     def test_unload(self):
-        self.solr_admin.create("wheatley")
-        self.assertIn('<int name="status">0</int>', self.solr_admin.unload("wheatley"))
+        self.solr_admin.unload("wheatley")
+        self.assertRequestParams({"action": "UNLOAD", "core": "wheatley"})
 
     def test_load(self):
         self.assertRaises(NotImplementedError, self.solr_admin.load, "wheatley")
+        self.session.get.assert_not_called()
+
+    def test_session_reuse(self):
+        solr_admin = SolrCoreAdmin("http://localhost:8983/solr/admin/cores")
+        session = solr_admin.get_session()
+        self.assertIs(session, solr_admin.get_session())
+
+        solr_admin.close()
+        self.assertIsNone(solr_admin.session)
+        self.assertIsNot(session, solr_admin.get_session())
+
+    def test_close_leaves_caller_session_open(self):
+        self.solr_admin.close()
+        self.session.close.assert_not_called()
+        self.assertIs(self.solr_admin.session, self.session)
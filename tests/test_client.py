@@ -2,166 +2,29 @@
 
 from __future__ import absolute_import, unicode_literals
 
-import datetime
 import random
 import time
 import unittest
-from io import StringIO
+from io import BytesIO
+from unittest.mock import Mock
+from urllib.parse import quote
 from xml.etree import ElementTree  # noqa: ICN001
 
-from pysolr import (
-    NESTED_DOC_KEY,
-    Results,
-    Solr,
-    SolrError,
-    clean_xml_string,
-    force_bytes,
-    force_unicode,
-    json,
-    safe_urlencode,
-    sanitize,
-    unescape_html,
-)
-
-try:
-    from unittest.mock import Mock
-except ImportError:
-    from mock import Mock
-
-try:
-    from urllib.parse import unquote_plus
-except ImportError:
-    from urllib import unquote_plus
-
-try:
-    from urllib.parse import quote
-except ImportError:
-    from urllib import quote
-
-
-class UtilsTestCase(unittest.TestCase):
-    def test_unescape_html(self):
-        self.assertEqual(unescape_html("Hello &#149; world"), "Hello \x95 world")
-        self.assertEqual(unescape_html("Hello &#x64; world"), "Hello d world")
-        self.assertEqual(unescape_html("Hello &amp; ☃"), "Hello & ☃")
-        self.assertEqual(
-            unescape_html("Hello &doesnotexist; world"), "Hello &doesnotexist; world"
-        )
-
-    def test_safe_urlencode(self):
-        self.assertEqual(
-            force_unicode(
-                unquote_plus(safe_urlencode({"test": "Hello ☃! Helllo world!"}))
-            ),
-            "test=Hello ☃! Helllo world!",
-        )
-        self.assertEqual(
-            force_unicode(
-                unquote_plus(
-                    safe_urlencode({"test": ["Hello ☃!", "Helllo world!"]}, True)
-                )
-            ),
-            "test=Hello \u2603!&test=Helllo world!",
-        )
-        self.assertEqual(
-            force_unicode(
-                unquote_plus(
-                    safe_urlencode({"test": ("Hello ☃!", "Helllo world!")}, True)
-                )
-            ),
-            "test=Hello \u2603!&test=Helllo world!",
-        )
-
-    def test_sanitize(self):
-        self.assertEqual(
-            sanitize(
-                "\x00\x01\x02\x03\x04\x05\x06\x07\x08\x0b\x0c\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19h\x1ae\x1bl\x1cl\x1do\x1e\x1f"  # NOQA: E501
-            ),
-            "hello",
-        ),
-
-    def test_force_unicode(self):
-        self.assertEqual(force_unicode(b"Hello \xe2\x98\x83"), "Hello ☃")
-        # Don't mangle, it's already Unicode.
-        self.assertEqual(force_unicode("Hello ☃"), "Hello ☃")
+import requests
 
-        self.assertEqual(force_unicode(1), "1", "force_unicode() should convert ints")
-        self.assertEqual(
-            force_unicode(1.0), "1.0", "force_unicode() should convert floats"
-        )
-        self.assertEqual(
-            force_unicode(None), "None", "force_unicode() should convert None"
-        )
-
-    def test_force_bytes(self):
-        self.assertEqual(force_bytes("Hello ☃"), b"Hello \xe2\x98\x83")
-        # Don't mangle, it's already a bytestring.
-        self.assertEqual(force_bytes(b"Hello \xe2\x98\x83"), b"Hello \xe2\x98\x83")
+from pysolr import NESTED_DOC_KEY, Solr, SolrError, json
 
-    def test_clean_xml_string(self):
-        self.assertEqual(clean_xml_string("\x00\x0b\x0d\uffff"), "\x0d")
-
-
-class ResultsTestCase(unittest.TestCase):
-    def test_init(self):
-        default_results = Results(
-            {"response": {"docs": [{"id": 1}, {"id": 2}], "numFound": 2}}
-        )
-
-        self.assertEqual(default_results.docs, [{"id": 1}, {"id": 2}])
-        self.assertEqual(default_results.hits, 2)
-        self.assertEqual(default_results.highlighting, {})
-        self.assertEqual(default_results.facets, {})
-        self.assertEqual(default_results.spellcheck, {})
-        self.assertEqual(default_results.stats, {})
-        self.assertIsNone(default_results.qtime)
-        self.assertEqual(default_results.debug, {})
-        self.assertEqual(default_results.grouped, {})
-
-        full_results = Results(
-            {
-                "response": {"docs": [{"id": 1}, {"id": 2}, {"id": 3}], "numFound": 3},
-                # Fake data just to check assignments.
-                "highlighting": "hi",
-                "facet_counts": "fa",
-                "spellcheck": "sp",
-                "stats": "st",
-                "responseHeader": {"QTime": "0.001"},
-                "debug": True,
-                "grouped": ["a"],
-            }
-        )
-
-        self.assertEqual(full_results.docs, [{"id": 1}, {"id": 2}, {"id": 3}])
-        self.assertEqual(full_results.hits, 3)
-        self.assertEqual(full_results.highlighting, "hi")
-        self.assertEqual(full_results.facets, "fa")
-        self.assertEqual(full_results.spellcheck, "sp")
-        self.assertEqual(full_results.stats, "st")
-        self.assertEqual(full_results.qtime, "0.001")
-        self.assertTrue(full_results.debug)
-        self.assertEqual(full_results.grouped, ["a"])
-
-    def test_len(self):
-        small_results = Results(
-            {"response": {"docs": [{"id": 1}, {"id": 2}], "numFound": 2}}
-        )
-        self.assertEqual(len(small_results), 2)
-
-        wrong_hits_results = Results(
-            {"response": {"docs": [{"id": 1}, {"id": 2}, {"id": 3}], "numFound": 7}}
-        )
-        self.assertEqual(len(wrong_hits_results), 3)
-
-    def test_iter(self):
-        long_results = Results(
-            {"response": {"docs": [{"id": 1}, {"id": 2}, {"id": 3}], "numFound": 7}}
-        )
-
-        to_iter = list(long_results)
-        self.assertEqual(to_iter[0], {"id": 1})
-        self.assertEqual(to_iter[1], {"id": 2})
-        self.assertEqual(to_iter[2], {"id": 3})
+# Uploaded by the extract tests, as a file opened in binary mode would be:
+EXTRACT_HTML = """
+    <html>
+        <head>
+            <meta charset="utf-8">
+            <meta name="haystack-test" content="test 1234">
+            <title>Test Title ☃&#x2603;</title>
+        </head>
+            <body>foobar</body>
+    </html>
+"""
 
 
 class SolrTestCaseMixin(object):
@@ -174,6 +37,18 @@ class SolrTestCaseMixin(object):
 
 
 class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
+    @classmethod
+    def setUpClass(cls):
+        super(SolrTestCase, cls).setUpClass()
+        # Every test gets a fresh client but they all share this session so that
+        # the connection to Solr is kept open between tests:
+        cls.session = requests.Session()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.session.close()
+        super(SolrTestCase, cls).tearDownClass()
+
     def setUp(self):
         super(SolrTestCase, self).setUp()
         self.solr = self.get_solr("core0")
@@ -234,13 +109,15 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
             },
         ]
 
-        # Clear it.
-        self.solr.delete(q="*:*", commit=True)
+        # Clear it. The commit is left to the add below, which makes both the
+        # delete and the new docs visible at once.
+        self.solr.delete(q="*:*", commit=False)
 
         # Index our docs. Yes, this leans on functionality we're going to test
         # later & if it's broken, everything will catastrophically fail.
-        # Such is life.
-        self.solr.add(self.docs, commit=True)
+        # Such is life. A soft commit is enough to make the docs searchable
+        # without flushing the index to disk.
+        self.solr.add(self.docs, softCommit=True)
 
         # Mock the _send_request method on the solr instance so that we can
         # test that custom handlers are called correctly.
@@ -261,6 +138,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
             "http://localhost:8983/solr/%s" % collection,
             timeout=timeout,
             always_commit=always_commit,
+            session=self.session,
         )
 
     def test_init(self):
@@ -335,8 +213,11 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
     def test__send_request_to_bad_path(self):
         # Test a non-existent URL:
         self.solr.url = "http://127.0.0.1:56789/whatever"
-        self.assertRaises(
-            SolrError, self.solr._send_request, "get", "select/?q=doc&wt=json"
+        with self.assertRaises(SolrError) as cm:
+            self.solr._send_request("get", "select/?q=doc&wt=json")
+        # The underlying requests error is kept as the cause:
+        self.assertIsInstance(
+            cm.exception.__cause__, requests.exceptions.ConnectionError
         )
 
     def test_send_request_to_bad_core(self):
@@ -349,12 +230,12 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
     def test__select(self):
         # Short params.
         resp_body = self.solr._select({"q": "doc"})
-        resp_data = json.loads(resp_body)
+        resp_data = self.solr.decoder.decode(resp_body)
         self.assertEqual(resp_data["response"]["numFound"], 3)
 
         # Long params.
         resp_body = self.solr._select({"q": "doc" * 1024})
-        resp_data = json.loads(resp_body)
+        resp_data = self.solr.decoder.decode(resp_body)
         self.assertEqual(resp_data["response"]["numFound"], 0)
         self.assertEqual(len(resp_data["responseHeader"]["params"]["q"]), 3 * 1024)
 
@@ -362,7 +243,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         resp_body = self.solr._select(
             {"q": "*", "cursorMark": "*", "sort": "id desc", "start": 0, "rows": 2}
         )
-        resp_data = json.loads(resp_body)
+        resp_data = self.solr.decoder.decode(resp_body)
         self.assertEqual(len(resp_data["response"]["docs"]), 2)
         self.assertIn("nextCursorMark", resp_data)
 
@@ -373,12 +254,12 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
 
     def test__mlt(self):
         resp_body = self.solr._mlt({"q": "id:doc_1", "mlt.fl": "title"})
-        resp_data = json.loads(resp_body)
+        resp_data = self.solr.decoder.decode(resp_body)
         self.assertEqual(resp_data["response"]["numFound"], 0)
 
     def test__suggest_terms(self):
         resp_body = self.solr._select({"terms.fl": "title"})
-        resp_data = json.loads(resp_body)
+        resp_data = self.solr.decoder.decode(resp_body)
         self.assertEqual(resp_data["response"]["numFound"], 0)
 
     def test__update(self):
@@ -453,6 +334,21 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         )
         self.assertEqual(resp_2, ("Wow. Seriously weird.", ""))
 
+        # Jetty's own error page nests the <pre> in a <p>, and the reason may
+        # contain entities:
+        resp_3 = self.solr._scrape_response(
+            {"server": "Jetty(9.4.x)"},
+            "<html><body><h2>HTTP ERROR 400</h2><p>Problem accessing /solr/core0/select. Reason:<pre>Can&#39;t parse &quot;q&quot; &amp; fail</pre></p></body></html>",  # NOQA: E501
+        )
+        self.assertEqual(resp_3, ('Can\'t parse "q" & fail', ""))
+
+        # Pages which aren't well-formed XML still yield a reason:
+        resp_4 = self.solr._scrape_response(
+            {"server": "crapzilla"},
+            "<html><head><meta charset=utf-8><title>Service Unavailable</title></head><body><hr></body></html>",  # NOQA: E501
+        )
+        self.assertEqual(resp_4, ("Service Unavailable", ""))
+
     def test__scrape_response_coyote_xml(self):
         resp_3 = self.solr._scrape_response(
             {"server": "coyote"},
@@ -497,77 +393,6 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         self.assertIsNone(reason, None)
         self.assertEqual(full_html, bogus_xml.replace("\n", ""))
 
-    def test__from_python(self):
-        self.assertEqual(self.solr._from_python(True), "true")
-        self.assertEqual(self.solr._from_python(False), "false")
-        self.assertEqual(self.solr._from_python(1), "1")
-        self.assertEqual(self.solr._from_python(1.2), "1.2")
-        self.assertEqual(self.solr._from_python(b"hello"), "hello")
-        self.assertEqual(self.solr._from_python("hello ☃"), "hello ☃")
-        self.assertEqual(self.solr._from_python("\x01test\x02"), "test")
-
-    def test__from_python_dates(self):
-        self.assertEqual(
-            self.solr._from_python(datetime.date(2013, 1, 18)), "2013-01-18T00:00:00Z"
-        )
-        self.assertEqual(
-            self.solr._from_python(datetime.datetime(2013, 1, 18, 0, 30, 28)),
-            "2013-01-18T00:30:28Z",
-        )
-
-        class FakeTimeZone(datetime.tzinfo):
-            offset = 0
-
-            def utcoffset(self, dt):
-                return datetime.timedelta(minutes=self.offset)
-
-            def dst(self):
-                return None
-
-        # Check a UTC timestamp
-        self.assertEqual(
-            self.solr._from_python(
-                datetime.datetime(2013, 1, 18, 0, 30, 28, tzinfo=FakeTimeZone())
-            ),
-            "2013-01-18T00:30:28Z",
-        )
-
-        # Check a US Eastern Standard Time timestamp
-        FakeTimeZone.offset = -(5 * 60)
-        self.assertEqual(
-            self.solr._from_python(
-                datetime.datetime(2013, 1, 18, 0, 30, 28, tzinfo=FakeTimeZone())
-            ),
-            "2013-01-18T05:30:28Z",
-        )
-
-    def test__to_python(self):
-        self.assertEqual(
-            self.solr._to_python("2013-01-18T00:00:00Z"), datetime.datetime(2013, 1, 18)
-        )
-        self.assertEqual(
-            self.solr._to_python("2013-01-18T00:30:28Z"),
-            datetime.datetime(2013, 1, 18, 0, 30, 28),
-        )
-        self.assertTrue(self.solr._to_python("true"))
-        self.assertFalse(self.solr._to_python("false"))
-        self.assertEqual(self.solr._to_python(1), 1)
-        self.assertEqual(self.solr._to_python(1.2), 1.2)
-        self.assertEqual(self.solr._to_python(b"hello"), "hello")
-        self.assertEqual(self.solr._to_python("hello ☃"), "hello ☃")
-        self.assertEqual(self.solr._to_python(["foo", "bar"]), ["foo", "bar"])
-        self.assertEqual(self.solr._to_python(("foo", "bar")), ("foo", "bar"))
-        self.assertEqual(
-            self.solr._to_python('tuple("foo", "bar")'), 'tuple("foo", "bar")'
-        )
-
-    def test__is_null_value(self):
-        self.assertTrue(self.solr._is_null_value(None))
-        self.assertTrue(self.solr._is_null_value(""))
-
-        self.assertFalse(self.solr._is_null_value("Hello"))
-        self.assertFalse(self.solr._is_null_value(1))
-
     def test_search(self):
         results = self.solr.search("doc")
         self.assertEqual(len(results), 3)
@@ -677,18 +502,22 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
             "price": 12.59,
             "popularity": 10,
         }
-        doc_xml = force_unicode(
-            ElementTree.tostring(self.solr._build_xml_doc(doc), encoding="utf-8")
-        )
+        doc_xml = self.solr._build_xml_doc(doc)
         self.assertIn('<field name="title">Example doc ☃ 1</field>', doc_xml)
         self.assertIn('<field name="id">doc_1</field>', doc_xml)
-        self.assertEqual(len(doc_xml), 152)
+        # Pin the exact output so that reordered or altered fields are caught,
+        # which a length check would miss:
+        self.assertEqual(
+            doc_xml,
+            '<doc><field name="id">doc_1</field>'
+            '<field name="title">Example doc ☃ 1</field>'
+            '<field name="price">12.59</field>'
+            '<field name="popularity">10</field></doc>',
+        )
 
     def test__build_xml_doc_with_sets(self):
         doc = {"id": "doc_1", "title": "Set test doc", "tags": {"alpha", "beta"}}
-        doc_xml = force_unicode(
-            ElementTree.tostring(self.solr._build_xml_doc(doc), encoding="utf-8")
-        )
+        doc_xml = self.solr._build_xml_doc(doc)
         self.assertIn('<field name="id">doc_1</field>', doc_xml)
         self.assertIn('<field name="title">Set test doc</field>', doc_xml)
         self.assertIn('<field name="tags">alpha</field>', doc_xml)
@@ -717,7 +546,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
             "popularity": 10,
             "_doc": sub_docs,
         }
-        doc_xml = self.solr._build_xml_doc(doc)
+        doc_xml = ElementTree.fromstring(self.solr._build_xml_doc(doc))
         self.assertEqual(doc_xml.find("*[@name='id']").text, doc["id"])
 
         children_docs = doc_xml.findall("doc")
@@ -733,9 +562,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
             "price": None,
             "tags": [],
         }
-        doc_xml = force_unicode(
-            ElementTree.tostring(self.solr._build_xml_doc(doc), encoding="utf-8")
-        )
+        doc_xml = self.solr._build_xml_doc(doc)
         self.assertNotIn('<field name="title" />', doc_xml)
         self.assertNotIn('<field name="price" />', doc_xml)
         self.assertNotIn('<field name="tags" />', doc_xml)
@@ -753,12 +580,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
             "title": "set",
             "tags": "set",
         }
-        doc_xml = force_unicode(
-            ElementTree.tostring(
-                self.solr._build_xml_doc(doc, fieldUpdates=fieldUpdates),
-                encoding="utf-8",
-            )
-        )
+        doc_xml = self.solr._build_xml_doc(doc, fieldUpdates=fieldUpdates)
         self.assertIn('<field name="title" null="true" update="set" />', doc_xml)
         self.assertNotIn('<field name="price" />', doc_xml)
         self.assertIn('<field name="tags" null="true" update="set" />', doc_xml)
@@ -769,7 +591,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         doc = {"id": "doc_1", "title": "", "price": 12.59, "popularity": 10}
 
         doc_json = self.solr._build_json_doc(doc)
-        doc_xml = self.solr._build_xml_doc(doc)
+        doc_xml = ElementTree.fromstring(self.solr._build_xml_doc(doc))
         self.assertNotIn("title", doc_json)
         self.assertIsNone(doc_xml.find("*[name='title']"))
 
@@ -782,6 +604,13 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         docs = [{"id": "doc_1", "title": "", "price": 12.59, "popularity": 10}]
         solrapi, m, len_message = self.solr._build_docs(docs, boost={"title": 10.0})
         self.assertEqual(solrapi, "XML")
+        self.assertEqual(len_message, 1)
+        self.assertEqual(
+            m,
+            '<add><doc><field name="id">doc_1</field>'
+            '<field name="price">12.59</field>'
+            '<field name="popularity">10</field></doc></add>',
+        )
 
     def test__build_docs_field_updates(self):
         docs = [{"id": "doc_1", "popularity": 10}]
@@ -799,7 +628,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
                 {"id": "doc_6", "title": "Newly added doc"},
                 {"id": "doc_7", "title": "Another example doc"},
             ],
-            commit=True,
+            softCommit=True,
         )
         # add should default to 'update' handler
         args, kwargs = self.solr._send_request.call_args
@@ -822,7 +651,9 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         )
 
         self.solr.add(
-            [{"id": "doc_7", "title": "Spam doc doc"}], boost={"title": 0}, commit=True
+            [{"id": "doc_7", "title": "Spam doc doc"}],
+            boost={"title": 0},
+            softCommit=True,
         )
 
         res = self.solr.search("doc")
@@ -851,7 +682,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         updateList = []
         for doc in originalDocs:
             updateList.append({"id": doc["id"], "popularity": 5})
-        self.solr.add(updateList, fieldUpdates={"popularity": "inc"}, commit=True)
+        self.solr.add(updateList, fieldUpdates={"popularity": "inc"}, softCommit=True)
 
         updatedDocs = self.solr.search("doc")
         self.assertEqual(len(updatedDocs), 3)
@@ -874,7 +705,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         updateList = []
         for doc in originalDocs:
             updateList.append({"id": doc["id"], "popularity": updated_popularity})
-        self.solr.add(updateList, fieldUpdates={"popularity": "set"}, commit=True)
+        self.solr.add(updateList, fieldUpdates={"popularity": "set"}, softCommit=True)
 
         updatedDocs = self.solr.search("doc")
         self.assertEqual(len(updatedDocs), 3)
@@ -904,7 +735,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
                     "word_ss": ["charlie", "delta"],
                 },
             ],
-            commit=True,
+            softCommit=True,
         )
 
         originalDocs = self.solr.search("multivalued")
@@ -912,7 +743,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         updateList = []
         for doc in originalDocs:
             updateList.append({"id": doc["id"], "word_ss": ["epsilon", "gamma"]})
-        self.solr.add(updateList, fieldUpdates={"word_ss": "add"}, commit=True)
+        self.solr.add(updateList, fieldUpdates={"word_ss": "add"}, softCommit=True)
 
         updatedDocs = self.solr.search("multivalued")
         self.assertEqual(len(updatedDocs), 2)
@@ -1031,7 +862,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
                 {"id": "doc_overwrite_1", "title": "Kim is more awesome."},
             ],
             overwrite=False,
-            commit=True,
+            softCommit=True,
         )
         self.assertEqual(len(self.solr.search("id:doc_overwrite_1")), 2)
 
@@ -1059,18 +890,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         self.assertTrue(args[1].startswith("fakehandler"))
 
     def test_extract(self):
-        fake_f = StringIO(
-            """
-            <html>
-                <head>
-                    <meta charset="utf-8">
-                    <meta name="haystack-test" content="test 1234">
-                    <title>Test Title ☃&#x2603;</title>
-                </head>
-                    <body>foobar</body>
-            </html>
-        """
-        )
+        fake_f = BytesIO(EXTRACT_HTML.encode("utf-8"))
         fake_f.name = "test.html"
         extracted = self.solr.extract(fake_f)
         # extract should default to 'update/extract' handler
@@ -1102,18 +922,7 @@ class SolrTestCase(unittest.TestCase, SolrTestCaseMixin):
         self.assertEqual(["Test Title ☃☃"], m["title"])
 
     def test_extract_special_char_in_filename(self):
-        fake_f = StringIO(
-            """
-            <html>
-                <head>
-                    <meta charset="utf-8">
-                    <meta name="haystack-test" content="test 1234">
-                    <title>Test Title ☃&#x2603;</title>
-                </head>
-                    <body>foobar</body>
-            </html>
-        """
-        )
+        fake_f = BytesIO(EXTRACT_HTML.encode("utf-8"))
         fake_f.name = "test☃.html"
         extracted = self.solr.extract(fake_f)
         # extract should default to 'update/extract' handler
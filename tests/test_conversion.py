@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, unicode_literals
+
+import datetime
+import unittest
+from unittest.mock import Mock
+
+from pysolr import Solr
+
+
+class StrSubclass(str):
+    pass
+
+
+class DateTimeSubclass(datetime.datetime):
+    pass
+
+
+# (value, expected) pairs for ``Solr._from_python``:
+FROM_PYTHON_CASES = (
+    (True, "true"),
+    (False, "false"),
+    (1, "1"),
+    (1.2, "1.2"),
+    (b"hello", "hello"),
+    ("hello ☃", "hello ☃"),
+    ("\x01test\x02", "test"),
+    # Subclasses miss the exact-type converters and take the fallback path:
+    (StrSubclass("\x01test\x02"), "test"),
+    (DateTimeSubclass(2013, 1, 18, 0, 30, 28), "2013-01-18T00:30:28Z"),
+)
+
+# (value, expected) pairs for ``Solr._to_python``:
+TO_PYTHON_CASES = (
+    ("2013-01-18T00:00:00Z", datetime.datetime(2013, 1, 18)),
+    ("2013-01-18T00:30:28Z", datetime.datetime(2013, 1, 18, 0, 30, 28)),
+    # Fractional seconds are dropped:
+    ("2013-01-18T00:30:28.123Z", datetime.datetime(2013, 1, 18, 0, 30, 28)),
+    # Only ASCII digits make a Solr datetime:
+    ("٢٠١٣-01-18T00:00:00Z", "٢٠١٣-01-18T00:00:00Z"),
+    ("true", True),
+    ("false", False),
+    (1, 1),
+    (1.2, 1.2),
+    (b"hello", "hello"),
+    ("hello ☃", "hello ☃"),
+    (["foo", "bar"], ["foo", "bar"]),
+    (("foo", "bar"), ("foo", "bar")),
+    ('tuple("foo", "bar")', 'tuple("foo", "bar")'),
+)
+
+
+class SolrConversionTestCase(unittest.TestCase):
+    """
+    Checks the parts of the client which need no running Solr, mostly the
+    conversion of values to & from Solr.
+    """
+
+    def setUp(self):
+        super(SolrConversionTestCase, self).setUp()
+        self.solr = Solr("http://localhost:8983/solr/core0")
+
+    def test__from_python(self):
+        for value, expected in FROM_PYTHON_CASES:
+            with self.subTest(value=value):
+                self.assertEqual(self.solr._from_python(value), expected)
+
+    def test__from_python_dates(self):
+        self.assertEqual(
+            self.solr._from_python(datetime.date(2013, 1, 18)), "2013-01-18T00:00:00Z"
+        )
+        self.assertEqual(
+            self.solr._from_python(datetime.datetime(2013, 1, 18, 0, 30, 28)),
+            "2013-01-18T00:30:28Z",
+        )
+
+        class FakeTimeZone(datetime.tzinfo):
+            offset = 0
+
+            def utcoffset(self, dt):
+                return datetime.timedelta(minutes=self.offset)
+
+            def dst(self):
+                return None
+
+        # Check a UTC timestamp
+        self.assertEqual(
+            self.solr._from_python(
+                datetime.datetime(2013, 1, 18, 0, 30, 28, tzinfo=FakeTimeZone())
+            ),
+            "2013-01-18T00:30:28Z",
+        )
+
+        # Check a US Eastern Standard Time timestamp
+        FakeTimeZone.offset = -(5 * 60)
+        self.assertEqual(
+            self.solr._from_python(
+                datetime.datetime(2013, 1, 18, 0, 30, 28, tzinfo=FakeTimeZone())
+            ),
+            "2013-01-18T05:30:28Z",
+        )
+
+    def test__to_python(self):
+        for value, expected in TO_PYTHON_CASES:
+            with self.subTest(value=value):
+                self.assertEqual(self.solr._to_python(value), expected)
+
+    def test__is_null_value(self):
+        self.assertTrue(self.solr._is_null_value(None))
+        self.assertTrue(self.solr._is_null_value(""))
+
+        self.assertFalse(self.solr._is_null_value("Hello"))
+        self.assertFalse(self.solr._is_null_value(1))
+
+    def test_close(self):
+        session = self.solr.get_session()
+        self.solr.close()
+        self.assertIsNone(self.solr.session)
+        self.assertIsNot(session, self.solr.get_session())
+
+        # A session passed in by the caller is not ours to close.
+        session = Mock()
+        solr = Solr("http://localhost:8983/solr/core0", session=session)
+        solr.close()
+        session.close.assert_not_called()
+        self.assertIs(solr.session, session)
+
+    def test__update_with_qt_param(self):
+        self.solr.use_qt_param = True
+        self.solr._send_request = Mock(return_value="")
+
+        self.solr._update("<add />", handler="/update", commit=False)
+        args, kwargs = self.solr._send_request.call_args
+        self.assertEqual(args[1], "select/?qt=%2Fupdate")
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, unicode_literals
+
+import unittest
+
+from pysolr import Results
+
+
+class ResultsTestCase(unittest.TestCase):
+    def test_init(self):
+        default_results = Results(
+            {"response": {"docs": [{"id": 1}, {"id": 2}], "numFound": 2}}
+        )
+
+        self.assertEqual(default_results.docs, [{"id": 1}, {"id": 2}])
+        self.assertEqual(default_results.hits, 2)
+        self.assertEqual(default_results.highlighting, {})
+        self.assertEqual(default_results.facets, {})
+        self.assertEqual(default_results.spellcheck, {})
+        self.assertEqual(default_results.stats, {})
+        self.assertIsNone(default_results.qtime)
+        self.assertEqual(default_results.debug, {})
+        self.assertEqual(default_results.grouped, {})
+
+        full_results = Results(
+            {
+                "response": {"docs": [{"id": 1}, {"id": 2}, {"id": 3}], "numFound": 3},
+                # Fake data just to check assignments.
+                "highlighting": "hi",
+                "facet_counts": "fa",
+                "spellcheck": "sp",
+                "stats": "st",
+                "responseHeader": {"QTime": "0.001"},
+                "debug": True,
+                "grouped": ["a"],
+            }
+        )
+
+        self.assertEqual(full_results.docs, [{"id": 1}, {"id": 2}, {"id": 3}])
+        self.assertEqual(full_results.hits, 3)
+        self.assertEqual(full_results.highlighting, "hi")
+        self.assertEqual(full_results.facets, "fa")
+        self.assertEqual(full_results.spellcheck, "sp")
+        self.assertEqual(full_results.stats, "st")
+        self.assertEqual(full_results.qtime, "0.001")
+        self.assertTrue(full_results.debug)
+        self.assertEqual(full_results.grouped, ["a"])
+
+    def test_len(self):
+        small_results = Results(
+            {"response": {"docs": [{"id": 1}, {"id": 2}], "numFound": 2}}
+        )
+        self.assertEqual(len(small_results), 2)
+
+        wrong_hits_results = Results(
+            {"response": {"docs": [{"id": 1}, {"id": 2}, {"id": 3}], "numFound": 7}}
+        )
+        self.assertEqual(len(wrong_hits_results), 3)
+
+    def test_iter(self):
+        long_results = Results(
+            {"response": {"docs": [{"id": 1}, {"id": 2}, {"id": 3}], "numFound": 7}}
+        )
+
+        to_iter = list(long_results)
+        self.assertEqual(to_iter[0], {"id": 1})
+        self.assertEqual(to_iter[1], {"id": 2})
+        self.assertEqual(to_iter[2], {"id": 3})
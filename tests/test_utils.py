@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import absolute_import, unicode_literals
+
+import math
+import unittest
+from urllib.parse import unquote_plus
+
+from pysolr import (
+    OrjsonDecoder,
+    clean_xml_string,
+    force_bytes,
+    force_unicode,
+    orjson,
+    safe_urlencode,
+    sanitize,
+    unescape_html,
+)
+
+
+class UtilsTestCase(unittest.TestCase):
+    def test_unescape_html(self):
+        self.assertEqual(unescape_html("Hello &#149; world"), "Hello \x95 world")
+        self.assertEqual(unescape_html("Hello &#x64; world"), "Hello d world")
+        self.assertEqual(unescape_html("Hello &amp; ☃"), "Hello & ☃")
+        self.assertEqual(
+            unescape_html("Hello &doesnotexist; world"), "Hello &doesnotexist; world"
+        )
+        # Long inputs bypass the cache but must be converted the same way:
+        self.assertEqual(unescape_html("&amp;" * 200), "&" * 200)
+
+    def test_safe_urlencode(self):
+        self.assertEqual(
+            force_unicode(
+                unquote_plus(safe_urlencode({"test": "Hello ☃! Helllo world!"}))
+            ),
+            "test=Hello ☃! Helllo world!",
+        )
+        self.assertEqual(
+            force_unicode(
+                unquote_plus(
+                    safe_urlencode({"test": ["Hello ☃!", "Helllo world!"]}, True)
+                )
+            ),
+            "test=Hello \u2603!&test=Helllo world!",
+        )
+        self.assertEqual(
+            force_unicode(
+                unquote_plus(
+                    safe_urlencode({"test": ("Hello ☃!", "Helllo world!")}, True)
+                )
+            ),
+            "test=Hello \u2603!&test=Helllo world!",
+        )
+
+    def test_sanitize(self):
+        self.assertEqual(
+            sanitize(
+                "\x00\x01\x02\x03\x04\x05\x06\x07\x08\x0b\x0c\x0e\x0f\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19h\x1ae\x1bl\x1cl\x1do\x1e\x1f"  # NOQA: E501
+            ),
+            "hello",
+        ),
+
+    def test_force_unicode(self):
+        self.assertEqual(force_unicode(b"Hello \xe2\x98\x83"), "Hello ☃")
+        # Don't mangle, it's already Unicode.
+        self.assertEqual(force_unicode("Hello ☃"), "Hello ☃")
+
+        self.assertEqual(force_unicode(1), "1", "force_unicode() should convert ints")
+        self.assertEqual(
+            force_unicode(1.0), "1.0", "force_unicode() should convert floats"
+        )
+        self.assertEqual(
+            force_unicode(None), "None", "force_unicode() should convert None"
+        )
+
+    def test_force_bytes(self):
+        self.assertEqual(force_bytes("Hello ☃"), b"Hello \xe2\x98\x83")
+        # Don't mangle, it's already a bytestring.
+        self.assertEqual(force_bytes(b"Hello \xe2\x98\x83"), b"Hello \xe2\x98\x83")
+
+    def test_clean_xml_string(self):
+        self.assertEqual(clean_xml_string("\x00\x0b\x0d\uffff"), "\x0d")
+
+    @unittest.skipIf(orjson is None, "orjson is not installed")
+    def test_orjson_decoder(self):
+        decoder = OrjsonDecoder()
+        self.assertEqual(
+            decoder.decode('{"response": {"numFound": 1, "docs": [{"id": "☃"}]}}'),
+            {"response": {"numFound": 1, "docs": [{"id": "☃"}]}},
+        )
+        # orjson rejects NaN, so this has to fall back to the stdlib decoder:
+        self.assertTrue(math.isnan(decoder.decode('{"mean": NaN}')["mean"]))
+        self.assertRaises(ValueError, decoder.decode, "{")
+        # orjson doesn't reject integers wider than 64 bits, it loses precision:
+        self.assertEqual(
+            decoder.decode('{"a": 18446744073709551616}'), {"a": 1.8446744073709552e19}
+        )